@@ -22,6 +22,10 @@ class Settings(BaseSettings):
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 5
 
+    JOURNAL_PATH: str = "./journal/activity.jsonl"
+    JOURNAL_BATCH_SIZE: int = 50
+    JOURNAL_FLUSH_INTERVAL: int = 10
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding='utf-8')
 
 
@@ -0,0 +1,4 @@
+from src.core.settings import settings
+from .journal import ActivityJournal, SessionSummary
+
+journal = ActivityJournal(settings.JOURNAL_PATH, settings.JOURNAL_BATCH_SIZE, settings.JOURNAL_FLUSH_INTERVAL)
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from os import path, makedirs
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionSummary:
+	"""
+	Aggregated journal activity of a single session over a time range.
+	"""
+	first_ts: float | None = None
+	last_ts: float | None = None
+	first_total: float = 0
+	last_total: float = 0
+	spent: float = 0
+	purchases: int = 0
+	taps: int = 0
+	daily_rewards: float = 0
+
+	@property
+	def earned(self) -> float:
+		return self.last_total - self.first_total
+
+	@property
+	def hours(self) -> float:
+		if self.first_ts is None:
+			return 0
+		return (self.last_ts - self.first_ts) / 3600
+
+	@property
+	def coins_per_hour(self) -> float:
+		return self.earned / self.hours if self.hours else 0
+
+
+class ActivityJournal:
+	"""
+	Append-only journal of bot activity stored as compact JSON lines.
+
+	Entries are buffered in memory and written behind in batches from a worker
+	thread, so recording an event never blocks the event loop on disk I/O.
+	"""
+
+	def __init__(self, journal_path: str, batch_size: int = 50, flush_interval: float = 10):
+		self.journal_path = journal_path
+		self.batch_size = batch_size
+		self.flush_interval = flush_interval
+		self._buffer: list[str] = []
+		self._flush_lock = asyncio.Lock()
+		self._flush_tasks: set[asyncio.Task] = set()
+		self._periodic_task: asyncio.Task | None = None
+
+	def record(self, session_name: str, event: str, **fields) -> None:
+		"""
+		Buffer a journal entry, scheduling a flush once the batch is full.
+
+		Args:
+			session_name (str): The name of the session.
+			event (str): The event type (profile, tap, boost, upgrade, energy or daily).
+			**fields: Event specific values.
+		"""
+		entry = {"ts": round(time.time(), 3), "s": session_name, "e": event, **fields}
+		self._buffer.append(json.dumps(entry, separators=(",", ":")))
+		if len(self._buffer) >= self.batch_size and not self._flush_tasks:
+			task = asyncio.get_running_loop().create_task(self.flush())
+			self._flush_tasks.add(task)
+			task.add_done_callback(self._flush_tasks.discard)
+
+	async def flush(self) -> None:
+		"""
+		Write all buffered entries to the journal file.
+
+		Entries that could not be written are kept in the buffer for the next flush.
+		"""
+		async with self._flush_lock:
+			lines, self._buffer = self._buffer, []
+			if not lines:
+				return
+			write = asyncio.ensure_future(asyncio.to_thread(self._write, lines))
+			try:
+				await asyncio.shield(write)
+			except OSError as e:
+				self._requeue(lines, e)
+			except asyncio.CancelledError:
+				# Hold the lock until the worker thread finishes, even if cancelled,
+				# so two threads never append to the journal at the same time.
+				await asyncio.wait([write])
+				if isinstance(write.exception(), OSError):
+					self._requeue(lines, write.exception())
+				raise
+
+	def _requeue(self, lines: list[str], error: OSError) -> None:
+		"""
+		Put entries from a failed write back at the front of the buffer.
+
+		Args:
+			lines (list[str]): The serialized entries that were not written.
+			error (OSError): The error raised by the write.
+		"""
+		logger.error(f"Failed to write {len(lines)} entries to {self.journal_path}: {error}")
+		self._buffer = lines + self._buffer
+
+	def _write(self, lines: list[str]) -> None:
+		"""
+		Append lines to the journal file, creating its directory if needed.
+
+		Args:
+			lines (list[str]): The serialized entries to append.
+		"""
+		directory = path.dirname(self.journal_path)
+		if directory and not path.exists(directory):
+			makedirs(directory)
+		with open(self.journal_path, "a", encoding="utf-8") as file:
+			file.write("\n".join(lines) + "\n")
+		logger.debug(f"Flushed {len(lines)} entries to {self.journal_path}.")
+
+	async def _flush_periodically(self) -> None:
+		"""
+		Flush the buffer every flush interval until cancelled.
+		"""
+		while True:
+			await asyncio.sleep(self.flush_interval)
+			try:
+				await self.flush()
+			except Exception as e:
+				logger.error(f"Periodic journal flush failed: {e}")
+
+	def start(self) -> None:
+		"""
+		Start the periodic background flush.
+		"""
+		if self._periodic_task is None or self._periodic_task.done():
+			self._periodic_task = asyncio.get_running_loop().create_task(self._flush_periodically())
+
+	async def close(self) -> None:
+		"""
+		Stop the periodic flush and write out any remaining entries.
+
+		Errors are logged instead of raised, so closing the journal never hides
+		the reason the bot stopped.
+		"""
+		if self._periodic_task is not None:
+			periodic_task, self._periodic_task = self._periodic_task, None
+			periodic_task.cancel()
+			try:
+				await periodic_task
+			except asyncio.CancelledError:
+				pass
+			except Exception as e:
+				logger.error(f"Periodic journal flush failed: {e}")
+		if self._flush_tasks:
+			await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+		try:
+			await self.flush()
+		except Exception as e:
+			logger.error(f"Final journal flush failed: {e}")
+		if self._buffer:
+			logger.error(f"{len(self._buffer)} journal entries could not be written to {self.journal_path}.")
+
+	def summarize(self, since: float | None = None, until: float | None = None) -> dict[str, SessionSummary]:
+		"""
+		Aggregate earnings and spending per session, streaming the journal line by line.
+
+		Args:
+			since (float | None): Only include entries at or after this UNIX timestamp.
+			until (float | None): Only include entries at or before this UNIX timestamp.
+
+		Returns:
+			dict[str, SessionSummary]: The summaries keyed by session name.
+		"""
+		summaries: dict[str, SessionSummary] = {}
+		if not path.exists(self.journal_path):
+			return summaries
+
+		with open(self.journal_path, encoding="utf-8") as file:
+			for line in file:
+				try:
+					entry = json.loads(line)
+				except json.JSONDecodeError:
+					continue
+				ts = entry["ts"]
+				if (since is not None and ts < since) or (until is not None and ts > until):
+					continue
+
+				summary = summaries.setdefault(entry["s"], SessionSummary())
+				event = entry["e"]
+				if event == "profile":
+					if summary.first_ts is None:
+						summary.first_ts = ts
+						summary.first_total = entry["t"]
+					summary.last_ts = ts
+					summary.last_total = entry["t"]
+				elif event == "tap":
+					summary.taps += entry["n"]
+				elif event in ("boost", "upgrade"):
+					summary.spent += entry["p"]
+					summary.purchases += 1
+				elif event == "daily":
+					summary.daily_rewards += entry["r"]
+		return summaries
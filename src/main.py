@@ -1,8 +1,11 @@
 import asyncio
 import random
+import time
 import argparse
+from datetime import datetime
 from telethon.sync import TelegramClient
 from src.core import settings
+from src.journal import journal
 from src.managers import SessionManager
 from src.tapper import Tapper
 
@@ -88,29 +91,40 @@ async def run_tapper(session_name: str) -> None:
 
 			while True:
 				try:
-					profile = await tapper.get_profile_data(token)
+					cycle_start = time.perf_counter()
+					profile, upgrades, tasks, boosts = await fetch_cycle_snapshot(tapper, token)
+					print(f"{session_name}: Fetched cycle data in {time.perf_counter() - cycle_start:.2f} seconds.")
+
 					if profile is None:
+						print(f"{session_name}: Cycle finished in {time.perf_counter() - cycle_start:.2f} seconds.")
 						print(f"{session_name}: Profile data is None. Retrying...")
 						await asyncio.sleep(settings.RETRY_DELAY)
 						continue
 
 					display_profile_info(profile, session_name)
+					record_profile_snapshot(profile, session_name)
 
 					if settings.AUTO_UPGRADE:
-						await process_upgrades(tapper, token, profile, session_name)
-
-					tasks = await tapper.get_tasks(token)
-
-					daily_task = next(task for task in tasks if task["id"] == "streak_days")
-
-					if not daily_task["isCompleted"]:
-						await tapper.check_task(token, daily_task["id"])
-						reward = daily_task["rewardCoins"]
-						days = daily_task["days"]
-
-						print(f"{session_name}: Completed daily task for {days} days. Reward: {reward}")
-
-					await process_taps(tapper, token, profile, session_name)
+						await process_upgrades(tapper, token, profile, upgrades, session_name)
+
+					if tasks is None:
+						print(f"{session_name}: Tasks data is None. Skipping daily task.")
+					else:
+						daily_task = next((task for task in tasks if task["id"] == "streak_days"), None)
+
+						if daily_task and not daily_task["isCompleted"]:
+							claimed = await tapper.check_task(token, daily_task["id"])
+							reward = daily_task["rewardCoins"]
+							days = daily_task["days"]
+							if claimed:
+								journal.record(session_name, "daily", r=reward, d=days)
+
+							print(f"{session_name}: Completed daily task for {days} days. Reward: {reward}")
+
+					waited = await process_taps(tapper, token, profile, boosts, session_name)
+					elapsed = time.perf_counter() - cycle_start
+					print(f"{session_name}: Cycle finished in {elapsed - waited:.2f} seconds "
+						  f"({elapsed:.2f} seconds including {waited} seconds waiting for energy).")
 				except Exception as e:
 					print(f"{session_name}: Error in tapping loop: {e}")
 					raise
@@ -119,6 +133,39 @@ async def run_tapper(session_name: str) -> None:
 			raise
 
 
+async def fetch_cycle_snapshot(tapper: Tapper, token: str) -> tuple[dict | None, list | None, list | None, list | None]:
+	"""
+	Fetch the profile, upgrades, tasks and boosts for one loop iteration concurrently.
+
+	Args:
+		tapper (Tapper): The tapper instance.
+		token (str): The access token.
+
+	Returns:
+		tuple: The profile data, upgrades, tasks and boosts. Upgrades are only requested
+		when AUTO_UPGRADE is enabled and are None otherwise.
+	"""
+	requests = [
+		tapper.get_profile_data(token),
+		tapper.get_tasks(token),
+		tapper.get_boosts_for_buy(token),
+	]
+	if settings.AUTO_UPGRADE:
+		requests.append(tapper.get_upgrades_for_buy(token))
+
+	request_tasks = [asyncio.create_task(request) for request in requests]
+	try:
+		profile, tasks, boosts, *rest = await asyncio.gather(*request_tasks)
+	except BaseException:
+		# Do not leave the remaining requests running when one of them fails.
+		for task in request_tasks:
+			task.cancel()
+		await asyncio.gather(*request_tasks, return_exceptions=True)
+		raise
+	upgrades = rest[0] if rest else None
+	return profile, upgrades, tasks, boosts
+
+
 def display_profile_info(profile: dict, session_name: str) -> None:
 	"""
 	Display specific information from the profile.
@@ -138,7 +185,25 @@ def display_profile_info(profile: dict, session_name: str) -> None:
 		f"{session_name}: Last Passive Earn: {last_passive_earn}, Balance Coins: {balance_coins}, Total Coins: {total_coins}")
 
 
-async def process_upgrades(tapper: Tapper, token: str, profile: dict, session_name: str) -> None:
+def record_profile_snapshot(profile: dict, session_name: str) -> None:
+	"""
+	Record the balance history fields of the profile in the activity journal.
+
+	Args:
+		profile (dict): The profile data.
+		session_name (str): The name of the session.
+	"""
+	journal.record(
+		session_name,
+		"profile",
+		b=profile.get("balanceCoins", 0),
+		t=profile.get("totalCoins", 0),
+		ph=profile.get("earnPassivePerHour", 0),
+	)
+
+
+async def process_upgrades(tapper: Tapper, token: str, profile: dict, upgrades: list | None,
+						   session_name: str) -> None:
 	"""
 	Process upgrades for the tapper bot.
 
@@ -146,6 +211,7 @@ async def process_upgrades(tapper: Tapper, token: str, profile: dict, session_na
 		tapper (Tapper): The tapper instance.
 		token (str): The access token.
 		profile (dict): The profile data.
+		upgrades (list | None): The upgrades available for purchase.
 		session_name (str): The name of the session.
 	"""
 
@@ -156,7 +222,6 @@ async def process_upgrades(tapper: Tapper, token: str, profile: dict, session_na
 				and upgrade.get("cooldownSeconds", 0) == 0
 		)
 
-	upgrades = await tapper.get_upgrades_for_buy(token)
 	if upgrades is None:
 		print(f"{session_name}: Upgrades data is None. Skipping upgrade process.")
 		return
@@ -185,13 +250,14 @@ async def process_upgrades(tapper: Tapper, token: str, profile: dict, session_na
 				upgrade["profitPerHourDelta"] for upgrade in upgrades if upgrade["id"] == upgrade_id)
 			payback_period = price / profit_per_hour_delta if profit_per_hour_delta != 0 else 0
 
-			await tapper.buy_upgrade(token, upgrade_id)
+			if await tapper.buy_upgrade(token, upgrade_id):
+				journal.record(session_name, "upgrade", id=upgrade_id, p=price)
 			profile["balanceCoins"] -= price
 			print(
 				f"{session_name}: Purchased upgrade {upgrade_id} for {price} coins. Payback period: {payback_period:.2f} hours.")
 
 
-async def process_taps(tapper: Tapper, token: str, profile: dict, session_name: str) -> None:
+async def process_taps(tapper: Tapper, token: str, profile: dict, boosts: list | None, session_name: str) -> int:
 	"""
 	Process taps for the tapper bot.
 
@@ -199,18 +265,22 @@ async def process_taps(tapper: Tapper, token: str, profile: dict, session_name:
 		tapper (Tapper): The tapper instance.
 		token (str): The access token.
 		profile (dict): The profile data.
+		boosts (list | None): The boosts available for purchase.
 		session_name (str): The name of the session.
+
+	Returns:
+		int: The number of seconds spent waiting for energy.
 	"""
 	available_energy = profile.get("availableTaps", 0)
-	boosts = await tapper.get_boosts_for_buy(token)
 	if boosts is None:
 		print(f"{session_name}: Boosts data is None. Skipping boosts process.")
-		return
+		return 0
 
 	for boost in boosts:
 		if boost["price"] <= profile["balanceCoins"] and boost["level"] < settings.MAX_LEVEL_BOOST and boost[
 			"id"] != "BoostFullAvailableTaps":
-			await tapper.buy_boost(token, boost["id"])
+			if await tapper.buy_boost(token, boost["id"]):
+				journal.record(session_name, "boost", id=boost["id"], p=boost["price"])
 			profile["balanceCoins"] -= boost["price"]
 
 	energy_boost = [boost for boost in boosts if boost["id"] == "BoostFullAvailableTaps"][0]
@@ -219,8 +289,9 @@ async def process_taps(tapper: Tapper, token: str, profile: dict, session_name:
 		if settings.APPLY_DAILY_ENERGY and energy_boost and energy_boost["cooldownSeconds"] == 0 and energy_boost[
 			"level"] <= energy_boost["maxLevel"]:
 			if await tapper.buy_boost(token, "BoostFullAvailableTaps"):
+				journal.record(session_name, "energy")
 				print(f"{session_name}: Energy boost activated.")
-				return
+				return 0
 
 		sleep_time = random.randint(*settings.SEND_TAPS_WAIT)
 		print(f"{session_name}: Not enough energy. Waiting for {sleep_time} seconds.")
@@ -229,6 +300,7 @@ async def process_taps(tapper: Tapper, token: str, profile: dict, session_name:
 		cooldown_time = random.randint(*settings.SEND_TAPS_COOLDOWN)
 		print(f"{session_name}: Cooling down for {cooldown_time} seconds.")
 		await asyncio.sleep(cooldown_time)
+		return sleep_time + cooldown_time
 
 	else:
 		taps_count = random.randint(*settings.SEND_TAPS_COUNT)
@@ -239,10 +311,14 @@ async def process_taps(tapper: Tapper, token: str, profile: dict, session_name:
 		)
 		if profile is None:
 			print(f"{session_name}: Taps data is None. Skipping taps process.")
-			return
+			return 0
+
+		journal.record(session_name, "tap", n=taps_count)
+		record_profile_snapshot(profile, session_name)
 
 		print(f"{session_name}: Sent {taps_count} taps. Updated profile:")
 		display_profile_info(profile, session_name)
+		return 0
 
 
 async def run_tapper_with_retries(session_name: str) -> None:
@@ -278,7 +354,39 @@ async def run_bot_for_all_sessions(session_manager: SessionManager) -> None:
 		print("No sessions found.")
 		return
 
-	await asyncio.gather(*(run_tapper_with_retries(session) for session in sessions))
+	journal.start()
+	tasks = [asyncio.create_task(run_tapper_with_retries(session)) for session in sessions]
+	try:
+		await asyncio.gather(*tasks)
+	finally:
+		# Stop the remaining sessions so nothing is recorded after the journal is closed.
+		for task in tasks:
+			task.cancel()
+		await asyncio.gather(*tasks, return_exceptions=True)
+		await journal.close()
+
+
+def show_journal_report(since: datetime = None, until: datetime = None) -> None:
+	"""
+	Print coins per hour and spend per session from the activity journal.
+
+	Args:
+		since (datetime): Start of the time range.
+		until (datetime): End of the time range.
+	"""
+	summaries = journal.summarize(
+		since=since.timestamp() if since else None,
+		until=until.timestamp() if until else None,
+	)
+	if not summaries:
+		print("No journal entries found.")
+		return
+
+	for session_name, summary in sorted(summaries.items()):
+		print(
+			f"{session_name}: Earned {summary.earned:.0f} coins in {summary.hours:.2f} hours "
+			f"({summary.coins_per_hour:.0f} per hour), spent {summary.spent:.0f} coins on {summary.purchases} purchases, "
+			f"sent {summary.taps} taps, daily rewards {summary.daily_rewards:.0f}.")
 
 
 async def main() -> None:
@@ -290,7 +398,14 @@ async def main() -> None:
 	parser.add_argument("--list-sessions", action="store_true", help="List all sessions")
 	parser.add_argument("--delete-session", type=str, help="Delete the session with the given name")
 	parser.add_argument("--run-bot", action="store_true", help="Run the bot for all sessions")
+	parser.add_argument("--journal-report", action="store_true", help="Show coins per hour and spend per session")
+	parser.add_argument("--since", type=datetime.fromisoformat,
+						help="Start of the journal report range (ISO 8601 datetime), requires --journal-report")
+	parser.add_argument("--until", type=datetime.fromisoformat,
+						help="End of the journal report range (ISO 8601 datetime), requires --journal-report")
 	args = parser.parse_args()
+	if (args.since or args.until) and not args.journal_report:
+		parser.error("--since and --until can only be used with --journal-report")
 
 	session_manager = SessionManager()
 
@@ -302,6 +417,8 @@ async def main() -> None:
 		await delete_session(session_manager, args.delete_session)
 	elif args.run_bot:
 		await run_bot_for_all_sessions(session_manager)
+	elif args.journal_report:
+		show_journal_report(args.since, args.until)
 	else:
 		while True:
 			display_menu()